@@ -0,0 +1,7 @@
+"""
+EU Novel Food Catalogue search. Run from the Python directory:
+
+    python -m SearchApp.main            # search GUI
+    python -m SearchApp.cli search chia # headless lookups
+    python -m SearchApp.eunovelfoods    # download novel_foods_complete.json
+"""
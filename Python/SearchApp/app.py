@@ -1,6 +1,6 @@
 import customtkinter as ctk
-import orjson
-from eunovelfoods import fetch_all_novel_foods, create_searchable_index, quick_search
+from .eunovelfoods import load_catalogue, quick_search
+from .instrumentation import span
 
 class NovelFoodSearch(ctk.CTk):
     def __init__(self):
@@ -8,9 +8,7 @@ class NovelFoodSearch(ctk.CTk):
         self.title("Novel Food Search")
         self.geometry("800x600")
         
-        with open('novel_foods_complete.json', 'r', encoding='utf-8') as f:
-            self.all_foods = orjson.loads(f.read())
-        self.index = create_searchable_index(self.all_foods)
+        self.all_foods, self.index = load_catalogue('novel_foods_complete.json')
 
         self.search_label = ctk.CTkLabel(self, text="Search Novel Food:", font=("Arial", 16))
         self.search_label.pack(pady=(20, 10))
@@ -39,9 +37,10 @@ class NovelFoodSearch(ctk.CTk):
             self.results_label.configure(text="Results: 0")
             return
         
-        # Perform search
-        results = quick_search(search_term, self.all_foods, self.index)
-        
+        with span('on_search', term=search_term):
+            self.show_results(quick_search(search_term, self.all_foods, self.index))
+
+    def show_results(self, results):
         # Limit to 30 items
         display_results = results[:30]
         total_count = len(results)
@@ -55,6 +54,10 @@ class NovelFoodSearch(ctk.CTk):
         # In your NovelFoodSearch class, update the display results section:
 
         # Display results
+        with span('render_results', count=len(display_results)):
+            self.render_results(display_results)
+
+    def render_results(self, display_results):
         for result in display_results:
             name = result.get('novel_food_name', 'N/A')
             common_name = result.get('common_name', '')
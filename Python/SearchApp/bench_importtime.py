@@ -0,0 +1,148 @@
+"""
+Cold start benchmark for the headless CLI.
+
+Runs SearchApp.cli in fresh interpreters and checks the best wall time of
+each case against BUDGET_MS. A separate `python -X importtime` run gives the
+per-module import breakdown, since that flag slows the interpreter down
+itself. Results are compared with the committed bench_importtime_baseline.json
+and appended to bench_importtime.jsonl (ignored by git, see --output).
+
+    python -m SearchApp.bench_importtime                  # narrow and broad search
+    python -m SearchApp.bench_importtime -- search "chia seed"
+    python -m SearchApp.bench_importtime --output /tmp/bench.jsonl
+
+The default cases search fixtures/novel_foods_sample.json repeated up to
+CATALOGUE_SIZE items, roughly the size of the real catalogue.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BUDGET_MS = 100
+CATALOGUE_SIZE = 3000
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURE = os.path.join(HERE, 'fixtures', 'novel_foods_sample.json')
+BASELINE = os.path.join(HERE, 'bench_importtime_baseline.json')
+RESULTS = os.path.join(HERE, 'bench_importtime.jsonl')
+# Lets `python -m SearchApp.cli` resolve from any working directory
+ENV = dict(os.environ, PYTHONPATH=os.path.dirname(HERE))
+
+def parse_importtime(stderr):
+    """Return (module, depth, self_us, cumulative_us) for every line of -X importtime output"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        # Nested imports are indented by two spaces per level after the leading space
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        imports.append((module.strip(), depth, int(self_us), int(cumulative_us)))
+    return imports
+
+def run_cli(cli_args, importtime=False):
+    flags = ['-X', 'importtime'] if importtime else []
+    proc = subprocess.run(
+        [sys.executable] + flags + ['-m', 'SearchApp.cli'] + cli_args,
+        env=ENV,
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:])
+        sys.exit(proc.returncode)
+    return proc
+
+def run(cli_args, runs=5):
+    """Return the best wall time in ms and the import breakdown for one case"""
+    wall_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_cli(cli_args)
+        wall_times.append((time.perf_counter() - start) * 1000)
+    imports = parse_importtime(run_cli(cli_args, importtime=True).stderr)
+    return min(wall_times), imports
+
+def write_catalogue(path):
+    """Repeat the fixture catalogue until it has CATALOGUE_SIZE items"""
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        sample = json.load(f)
+    foods = []
+    while len(foods) < CATALOGUE_SIZE:
+        n = len(foods) // len(sample)
+        for food in sample:
+            foods.append(dict(food, policy_item_code=f"{food['policy_item_code']}-{n}"))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(foods[:CATALOGUE_SIZE], f, ensure_ascii=False)
+
+def case_name(cli_args):
+    """Name a case by its CLI arguments, leaving out the temporary catalogue path"""
+    name = list(cli_args)
+    if '--catalogue' in name:
+        i = name.index('--catalogue')
+        del name[i:i + 2]
+    return ' '.join(name)
+
+def report(cli_args, wall_ms, imports, baseline):
+    top_level = [i for i in imports if i[1] == 0]
+    slowest = sorted(top_level, key=lambda i: i[3], reverse=True)[:10]
+    import_ms = sum(i[2] for i in imports) / 1000
+    name = case_name(cli_args)
+
+    print(f"SearchApp.cli {name}")
+    print(f"  wall time: {wall_ms:.1f} ms (budget {BUDGET_MS} ms)")
+    if name in baseline:
+        print(f"  baseline:  {baseline[name]['wall_ms']:.1f} ms")
+    print(f"  imports:   {len(imports)} modules, {import_ms:.1f} ms")
+    for module, _, _, cumulative_us in slowest:
+        print(f"    {cumulative_us / 1000:7.1f} ms  {module}")
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'case': name,
+        'wall_ms': round(wall_ms, 1),
+        'import_ms': round(import_ms, 1),
+        'slowest': [[module, cumulative_us] for module, _, _, cumulative_us in slowest],
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Cold start benchmark for SearchApp.cli")
+    parser.add_argument('--output', default=RESULTS, help="JSON lines file the results are appended to")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('cli_args', nargs=argparse.REMAINDER, help="arguments for SearchApp.cli, after --")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, 'r', encoding='utf-8') as f:
+            baseline = {record['case']: record for record in json.load(f)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogue = os.path.join(tmp, 'novel_foods_complete.json')
+        write_catalogue(catalogue)
+
+        cli_args = [a for a in args.cli_args if a != '--']
+        if cli_args:
+            cases = [cli_args]
+        else:
+            # A narrow query and a broad one that matches a large part of the catalogue
+            cases = [
+                ['--catalogue', catalogue, 'search', 'chia'],
+                ['--catalogue', catalogue, 'search', 'seed'],
+            ]
+
+        records = [report(case, *run(case, args.runs), baseline) for case in cases]
+
+    with open(args.output, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+    over = [r for r in records if r['wall_ms'] > BUDGET_MS]
+    for record in over:
+        print(f"'{record['case']}' over budget by {record['wall_ms'] - BUDGET_MS:.1f} ms")
+    if over:
+        sys.exit(1)
@@ -0,0 +1,103 @@
+"""
+Headless command line lookups against the Novel Food Catalogue.
+
+    python -m SearchApp.cli search "chia seed"
+    python -m SearchApp.cli analyze ingredients.txt
+    echo "Chia (Salvia hispanica), sugar" | python -m SearchApp.cli analyze
+
+Only the search engine is imported at start up. The GUI toolkit is never
+loaded and the catalogue is only read by commands that search it. The index
+is rebuilt on every run, see load_catalogue() for why that is cheap enough.
+"""
+import argparse
+import sys
+
+from .eunovelfoods import load_catalogue, quick_search
+
+GREEN = '\033[92m'
+RED = '\033[91m'
+ORANGE = '\033[93m'
+RESET = '\033[0m'
+
+def paint(args, color, text):
+    return f"{color}{text}{RESET}" if args.color else text
+
+def search(args):
+    foods, index = load_catalogue(args.catalogue)
+    results = quick_search(args.term, foods, index)
+
+    for result in results[:args.limit]:
+        name = result.get('novel_food_name', 'N/A')
+        common_name = result.get('common_name', '')
+        status = result.get('novel_food_status', 'N/A')
+        color = RED if status.lower() == 'novel food' else GREEN
+
+        if common_name:
+            print(paint(args, color, f"{name} ({common_name}) - {status}"))
+        else:
+            print(paint(args, color, f"{name} - {status}"))
+
+    if len(results) > args.limit:
+        print(f"Results: {len(results)} (showing first {args.limit})")
+    else:
+        print(f"Results: {len(results)}")
+
+def analyze(args):
+    from .ingredients import extract_ingredients, check_novel_status
+
+    text = args.file.read()
+    foods, index = load_catalogue(args.catalogue)
+
+    counts = {'novel': 0, 'not_novel': 0, 'unknown': 0}
+    for ing in extract_ingredients(text):
+        status, full_status = check_novel_status(
+            ing['common_name'],
+            ing['scientific_name'],
+            foods,
+            index
+        )
+        counts[status] += 1
+
+        color = {'novel': RED, 'not_novel': GREEN}.get(status, ORANGE)
+        line = ing['full_text']
+        if full_status:
+            line += f" [{full_status}]"
+        print(paint(args, color, line))
+
+    print(f"Novel: {counts['novel']} | Not Novel: {counts['not_novel']} | Unknown: {counts['unknown']}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search the EU Novel Food Catalogue from the terminal")
+    parser.add_argument('--catalogue', default='novel_foods_complete.json', help="catalogue JSON file")
+    parser.add_argument('--profile', metavar='FILE', help="write a cProfile report (e.g. cli.prof)")
+    parser.add_argument('--no-color', dest='color', action='store_false', help="never colour the output")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    search_parser = commands.add_parser('search', help="look up a single name or code")
+    search_parser.add_argument('term')
+    search_parser.add_argument('--limit', type=int, default=30)
+    search_parser.set_defaults(func=search)
+
+    analyze_parser = commands.add_parser('analyze', help="check every ingredient in a list")
+    analyze_parser.add_argument('file', nargs='?', type=argparse.FileType('r', encoding='utf-8'), default=sys.stdin)
+    analyze_parser.set_defaults(func=analyze)
+
+    args = parser.parse_args(argv)
+    # Colour codes are only useful on a terminal, not when piped or captured
+    args.color = args.color and sys.stdout.isatty()
+
+    try:
+        if args.profile:
+            from .instrumentation import profile
+
+            with profile(args.profile):
+                args.func(args)
+        else:
+            args.func(args)
+    except FileNotFoundError as e:
+        if e.filename == args.catalogue:
+            parser.error(f"catalogue '{args.catalogue}' not found, run 'python -m SearchApp.eunovelfoods' to download it")
+        raise
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import re
+
+from .eunovelfoods import quick_search
+from .instrumentation import timed
+
+INGREDIENT_SPLIT = re.compile(r'[,;\n]')
+INGREDIENT_NAMES = re.compile(r'^([^(]+)(?:\(([^)]+)\))?')
+
+@timed('extract_ingredients')
+def extract_ingredients(text):
+    """Extract individual ingredients from text"""
+    # Remove bold markers
+    text = text.replace("**", "")
+
+    # Split by common patterns: commas, semicolons, or newlines
+    ingredients = INGREDIENT_SPLIT.split(text)
+
+    extracted = []
+    for ingredient in ingredients:
+        ingredient = ingredient.strip()
+        if not ingredient or ingredient.isupper():  # Skip empty or section headers
+            continue
+
+        # Extract common name and scientific name separately
+        match = INGREDIENT_NAMES.match(ingredient)
+        if match:
+            common_name = match.group(1).strip()
+            scientific_name = match.group(2).strip() if match.group(2) else None
+
+            extracted.append({
+                'common_name': common_name,
+                'scientific_name': scientific_name,
+                'full_text': ingredient
+            })
+
+    return extracted
+
+def _classify(food):
+    status = food.get('novel_food_status', '')
+    if 'novel food' in status.lower() and 'not novel' not in status.lower():
+        return 'novel', status
+    return 'not_novel', status
+
+@timed('check_novel_status')
+def check_novel_status(common_name, scientific_name, foods_list, index):
+    """Check if ingredient is a novel food using both names"""
+    # Try scientific name first (usually more accurate)
+    if scientific_name:
+        results = quick_search(scientific_name, foods_list, index)
+        if results:
+            return _classify(results[0])
+
+    # Fall back to common name
+    results = quick_search(common_name, foods_list, index)
+    if results:
+        return _classify(results[0])
+
+    return 'unknown', None
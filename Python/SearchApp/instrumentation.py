@@ -0,0 +1,214 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Instrumentation is opt-in. Set NOVELFOODS_METRICS=1 (or call enable()) to record.
+# Metrics recorded that way are written to NOVELFOODS_METRICS_PATH.json/.prom on exit.
+_enabled = os.environ.get('NOVELFOODS_METRICS', '') not in ('', '0')
+METRICS_PATH = os.environ.get('NOVELFOODS_METRICS_PATH', 'novelfoods_metrics')
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+# Only the most recent spans are kept so long GUI sessions don't grow without bound
+MAX_SPANS = 10000
+_spans = deque(maxlen=MAX_SPANS)
+_local = threading.local()
+
+def enable():
+    global _enabled
+    _enabled = True
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _enabled
+
+def reset():
+    """Drop all recorded counters, histograms and spans"""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _spans.clear()
+
+def incr(name, value=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+def observe(name, seconds):
+    """Record a duration (in seconds) in the histogram called name"""
+    if not _enabled:
+        return
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = {'buckets': [0] * len(BUCKETS), 'sum': 0.0, 'count': 0}
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                hist['buckets'][i] += 1
+                break
+        hist['sum'] += seconds
+        hist['count'] += 1
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+@contextmanager
+def _record_span(name, attrs):
+    import uuid  # deferred so that importing this module stays cheap
+
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    parent = stack[-1] if stack else None
+    span_record = {
+        'trace_id': parent['trace_id'] if parent else uuid.uuid4().hex,
+        'span_id': uuid.uuid4().hex[:16],
+        'parent_id': parent['span_id'] if parent else None,
+        'name': name,
+        'attrs': attrs,
+        'start': time.time(),
+    }
+    stack.append(span_record)
+    start = time.perf_counter()
+    try:
+        yield span_record
+    finally:
+        duration = time.perf_counter() - start
+        stack.pop()
+        span_record['duration'] = duration
+        with _lock:
+            _spans.append(span_record)
+        observe(name, duration)
+
+def span(name, **attrs):
+    """Trace span context manager. Nested spans share the trace_id of the outermost one."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _record_span(name, attrs)
+
+def timed(name=None):
+    """Decorator that counts calls and records call duration in a histogram"""
+    def decorator(func):
+        metric = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            incr(metric + '_calls')
+            with _record_span(metric, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def snapshot():
+    """Return a copy of all recorded metrics as plain dicts"""
+    with _lock:
+        return {
+            'counters': dict(_counters),
+            'histograms': {
+                key: {
+                    'buckets': dict(zip(BUCKETS, hist['buckets'])),
+                    'sum': hist['sum'],
+                    'count': hist['count'],
+                }
+                for key, hist in _histograms.items()
+            },
+            'spans': [dict(s) for s in _spans],
+        }
+
+def export_json(indent=2):
+    data = snapshot()
+    # JSON object keys must be strings
+    for hist in data['histograms'].values():
+        hist['buckets'] = {str(bound): n for bound, n in hist['buckets'].items()}
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+def _prom_name(name):
+    return 'novelfoods_' + ''.join(c if c.isalnum() else '_' for c in name).lower()
+
+def export_prometheus():
+    """Render counters and histograms in the Prometheus text exposition format"""
+    data = snapshot()
+    lines = []
+    for key, value in sorted(data['counters'].items()):
+        metric = _prom_name(key) + '_total'
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    for key, hist in sorted(data['histograms'].items()):
+        metric = _prom_name(key) + '_seconds'
+        lines.append(f"# TYPE {metric} histogram")
+        cumulative = 0
+        for bound, n in hist['buckets'].items():
+            cumulative += n
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{le="+Inf"}} {hist["count"]}')
+        lines.append(f"{metric}_sum {hist['sum']}")
+        lines.append(f"{metric}_count {hist['count']}")
+    return '\n'.join(lines) + '\n'
+
+def write_metrics(base):
+    """Write the recorded metrics to base.json and base.prom"""
+    with open(base + '.json', 'w', encoding='utf-8') as f:
+        f.write(export_json())
+    with open(base + '.prom', 'w', encoding='utf-8') as f:
+        f.write(export_prometheus())
+
+def _write_metrics_at_exit():
+    try:
+        write_metrics(METRICS_PATH)
+        print(f"Metrics saved to '{METRICS_PATH}.json' and '{METRICS_PATH}.prom'", file=sys.stderr)
+    except OSError as e:
+        print(f"Could not write metrics: {e}", file=sys.stderr)
+
+if _enabled:
+    atexit.register(_write_metrics_at_exit)
+
+@contextmanager
+def profile(path):
+    """
+    Run the enclosed block under cProfile and dump the stats to path.
+    The .prof file can be opened with snakeviz or converted to a flamegraph
+    with flameprof. Metrics are enabled for the duration and written next to it.
+    """
+    import cProfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"Profile directory does not exist: {directory}")
+
+    was_enabled = _enabled
+    enable()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        try:
+            profiler.dump_stats(path)
+            write_metrics(os.path.splitext(path)[0] + '_metrics')
+            print(f"Profile saved to '{path}'", file=sys.stderr)
+        finally:
+            if not was_enabled:
+                disable()
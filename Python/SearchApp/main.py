@@ -1,13 +1,22 @@
 import customtkinter as ctk # CustomTkinter for modern UI
-import orjson # For faster JSON handling (needs to be imported)
-import time # Time keeping
 
-from eunovelfoods import fetch_all_novel_foods, create_searchable_index, quick_search
-from app import NovelFoodSearch
+from .app import NovelFoodSearch
+from .instrumentation import profile
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Novel Food Search")
+    parser.add_argument('--profile', metavar='FILE', help="write a cProfile report (e.g. search.prof)")
+    args = parser.parse_args()
+
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
     
-    app = NovelFoodSearch()
-    app.mainloop()
+    if args.profile:
+        with profile(args.profile):
+            app = NovelFoodSearch()
+            app.mainloop()
+    else:
+        app = NovelFoodSearch()
+        app.mainloop()
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from SearchApp import cli
+from SearchApp.eunovelfoods import load_catalogue, quick_search
+from SearchApp.ingredients import extract_ingredients, check_novel_status
+
+FOODS = [
+    {'novel_food_name': 'Salvia hispanica', 'common_name': 'Chia seed', 'policy_item_code': 'NF0001',
+     'synonyms': '', 'novel_food_status': 'Novel food'},
+    {'novel_food_name': 'Linum usitatissimum', 'common_name': 'Flaxseed', 'policy_item_code': 'NF0002',
+     'synonyms': '', 'novel_food_status': 'Not novel'},
+    {'novel_food_name': 'Tenebrio molitor', 'common_name': 'Yellow mealworm', 'policy_item_code': 'NF0003',
+     'synonyms': 'mealworm larva', 'novel_food_status': 'Novel food'},
+]
+
+@pytest.fixture
+def catalogue(tmp_path):
+    path = tmp_path / 'novel_foods_complete.json'
+    path.write_text(json.dumps(FOODS), encoding='utf-8')
+    return str(path)
+
+def test_search_prints_matches_without_colour_when_piped(catalogue, capsys):
+    cli.main(['--catalogue', catalogue, 'search', 'seed'])
+
+    assert capsys.readouterr().out.splitlines() == [
+        'Salvia hispanica (Chia seed) - Novel food',
+        'Linum usitatissimum (Flaxseed) - Not novel',
+        'Results: 2',
+    ]
+
+def test_search_limit(catalogue, capsys):
+    cli.main(['--catalogue', catalogue, 'search', 'a', '--limit', '1'])
+
+    assert capsys.readouterr().out.splitlines()[-1] == 'Results: 3 (showing first 1)'
+
+def test_analyze_summary_counts(catalogue, tmp_path, capsys):
+    ingredients = tmp_path / 'ingredients.txt'
+    ingredients.write_text("INGREDIENTS\nChia (Salvia hispanica), flaxseed; sugar\n", encoding='utf-8')
+
+    cli.main(['--catalogue', catalogue, 'analyze', str(ingredients)])
+
+    out = capsys.readouterr().out.splitlines()
+    assert out[-1] == 'Novel: 1 | Not Novel: 1 | Unknown: 1'
+    assert out[0] == 'Chia (Salvia hispanica) [Novel food]'
+
+def test_missing_catalogue_is_a_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(['--catalogue', str(tmp_path / 'missing.json'), 'search', 'chia'])
+
+    assert exit_info.value.code == 2
+    assert 'not found' in capsys.readouterr().err
+
+def test_extract_ingredients_splits_and_skips_headers():
+    text = "**INGREDIENTS**\nChia (Salvia hispanica), flaxseed;  sugar\n\n"
+
+    assert extract_ingredients(text) == [
+        {'common_name': 'Chia', 'scientific_name': 'Salvia hispanica', 'full_text': 'Chia (Salvia hispanica)'},
+        {'common_name': 'flaxseed', 'scientific_name': None, 'full_text': 'flaxseed'},
+        {'common_name': 'sugar', 'scientific_name': None, 'full_text': 'sugar'},
+    ]
+
+def test_check_novel_status_prefers_scientific_name(catalogue):
+    foods, index = load_catalogue(catalogue)
+
+    assert check_novel_status('Flaxseed', 'Salvia hispanica', foods, index) == ('novel', 'Novel food')
+    assert check_novel_status('Flaxseed', None, foods, index) == ('not_novel', 'Not novel')
+    assert check_novel_status('sugar', None, foods, index) == ('unknown', None)
+
+def test_quick_search_returns_each_item_once(catalogue):
+    foods, index = load_catalogue(catalogue)
+
+    # 'mealworm' matches both the common name and the synonyms of one item
+    assert quick_search('mealworm', foods, index) == [FOODS[2]]
+    assert len(quick_search('e', foods, index)) == 3
@@ -0,0 +1,89 @@
+import pytest
+
+from SearchApp import instrumentation
+
+@pytest.fixture(autouse=True)
+def metrics():
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.reset()
+    if not was_enabled:
+        instrumentation.disable()
+
+def prometheus_values(text):
+    values = {}
+    for line in text.splitlines():
+        if not line.startswith('#'):
+            key, value = line.rsplit(' ', 1)
+            values[key] = float(value)
+    return values
+
+def test_observe_buckets_are_cumulative_in_prometheus_export():
+    for seconds in (0.0001, 0.003, 0.003, 0.2, 60.0):
+        instrumentation.observe('lookup', seconds)
+
+    values = prometheus_values(instrumentation.export_prometheus())
+    metric = 'novelfoods_lookup_seconds'
+    assert values[f'{metric}_bucket{{le="0.0005"}}'] == 1
+    assert values[f'{metric}_bucket{{le="0.001"}}'] == 1
+    assert values[f'{metric}_bucket{{le="0.005"}}'] == 3
+    assert values[f'{metric}_bucket{{le="0.25"}}'] == 4
+    assert values[f'{metric}_bucket{{le="10.0"}}'] == 4
+    assert values[f'{metric}_bucket{{le="+Inf"}}'] == values[f'{metric}_count'] == 5
+    assert values[f'{metric}_sum'] == pytest.approx(60.2061)
+
+def test_disabled_records_nothing():
+    instrumentation.disable()
+    instrumentation.observe('lookup', 0.1)
+    instrumentation.incr('calls')
+    with instrumentation.span('request'):
+        pass
+
+    assert instrumentation.snapshot() == {'counters': {}, 'histograms': {}, 'spans': []}
+
+def test_nested_spans_share_trace_id():
+    with instrumentation.span('request') as outer:
+        with instrumentation.span('search') as inner:
+            pass
+    with instrumentation.span('request') as other:
+        pass
+
+    assert inner['trace_id'] == outer['trace_id']
+    assert inner['parent_id'] == outer['span_id']
+    assert outer['parent_id'] is None
+    assert other['trace_id'] != outer['trace_id']
+    assert [s['name'] for s in instrumentation.snapshot()['spans']] == ['search', 'request', 'request']
+
+def test_profile_rejects_missing_directory_before_profiling(tmp_path):
+    instrumentation.disable()
+    with pytest.raises(FileNotFoundError):
+        with instrumentation.profile(str(tmp_path / 'missing' / 'p.prof')):
+            pass
+    assert not instrumentation.is_enabled()
+
+def test_timed_counts_calls_and_records_histogram():
+    @instrumentation.timed('lookup')
+    def lookup(term):
+        return term.upper()
+
+    assert lookup('chia') == 'CHIA'
+    assert lookup('salvia') == 'SALVIA'
+
+    data = instrumentation.snapshot()
+    assert data['counters'] == {'lookup_calls': 2}
+    assert data['histograms']['lookup']['count'] == 2
+    assert sum(data['histograms']['lookup']['buckets'].values()) == 2
+
+def test_profile_writes_stats_and_metrics(tmp_path):
+    import pstats
+
+    path = tmp_path / 'p.prof'
+    with instrumentation.profile(str(path)):
+        instrumentation.observe('lookup', 0.01)
+
+    assert path.exists()
+    assert (tmp_path / 'p_metrics.json').exists()
+    assert (tmp_path / 'p_metrics.prom').exists()
+    assert pstats.Stats(str(path)).total_calls > 0
@@ -1,7 +1,7 @@
 import customtkinter as ctk
-import orjson
-import re
-from SearchApp.eunovelfoods import create_searchable_index, quick_search
+from SearchApp.eunovelfoods import load_catalogue
+from SearchApp.ingredients import extract_ingredients, check_novel_status
+from SearchApp.instrumentation import span, incr
 
 class IngredientAnalyzer(ctk.CTk):
     def __init__(self):
@@ -10,9 +10,7 @@ class IngredientAnalyzer(ctk.CTk):
         self.geometry("900x700")
         
         # Load data
-        with open('novel_foods_complete.json', 'rb') as f:
-            self.all_foods = orjson.loads(f.read())
-        self.index = create_searchable_index(self.all_foods)
+        self.all_foods, self.index = load_catalogue('novel_foods_complete.json')
         
         # Instructions
         self.instruction_label = ctk.CTkLabel(
@@ -45,54 +43,11 @@ class IngredientAnalyzer(ctk.CTk):
     
     def extract_ingredients(self, text):
         """Extract individual ingredients from text"""
-        # Remove bold markers
-        text = text.replace("**", "")
-        
-        # Split by common patterns: commas, semicolons, or newlines
-        ingredients = re.split(r'[,;\n]', text)
-        
-        extracted = []
-        for ingredient in ingredients:
-            ingredient = ingredient.strip()
-            if not ingredient or ingredient.isupper():  # Skip empty or section headers
-                continue
-            
-            # Extract common name and scientific name separately
-            match = re.match(r'^([^(]+)(?:\(([^)]+)\))?', ingredient)
-            if match:
-                common_name = match.group(1).strip()
-                scientific_name = match.group(2).strip() if match.group(2) else None
-                
-                extracted.append({
-                    'common_name': common_name,
-                    'scientific_name': scientific_name,
-                    'full_text': ingredient
-                })
-        
-        return extracted
+        return extract_ingredients(text)
     
     def check_novel_status(self, common_name, scientific_name):
         """Check if ingredient is a novel food using both names"""
-        # Try scientific name first (usually more accurate)
-        if scientific_name:
-            results = quick_search(scientific_name, self.all_foods, self.index)
-            if results:
-                status = results[0].get('novel_food_status', '').lower()
-                if 'novel food' in status and 'not novel' not in status:
-                    return 'novel', results[0].get('novel_food_status')
-                else:
-                    return 'not_novel', results[0].get('novel_food_status')
-        
-        # Fall back to common name
-        results = quick_search(common_name, self.all_foods, self.index)
-        if results:
-            status = results[0].get('novel_food_status', '').lower()
-            if 'novel food' in status and 'not novel' not in status:
-                return 'novel', results[0].get('novel_food_status')
-            else:
-                return 'not_novel', results[0].get('novel_food_status')
-        
-        return 'unknown', None
+        return check_novel_status(common_name, scientific_name, self.all_foods, self.index)
     
     def analyze_ingredients(self):
         # Clear previous results
@@ -105,6 +60,10 @@ class IngredientAnalyzer(ctk.CTk):
             self.results_label.configure(text="Please enter ingredients to analyze")
             return
         
+        with span('analyze_ingredients'):
+            self.show_analysis(input_text)
+
+    def show_analysis(self, input_text):
         # Extract ingredients
         ingredients = self.extract_ingredients(input_text)
         
@@ -118,6 +77,7 @@ class IngredientAnalyzer(ctk.CTk):
                 ing['common_name'], 
                 ing['scientific_name']
             )
+            incr('ingredients_' + status)
             
             if status == 'novel':
                 color = "#FF6B6B"  # Red
@@ -134,23 +94,36 @@ class IngredientAnalyzer(ctk.CTk):
             if full_status:
                 label_text += f" [{full_status}]"
             
-            label = ctk.CTkLabel(
-                self.output_frame,
-                text=label_text,
-                text_color=color,
-                anchor="w",
-                font=("Arial", 12),
-                wraplength=800
-            )
-            label.pack(pady=3, padx=10, fill="x")
+            with span('render_ingredient'):
+                label = ctk.CTkLabel(
+                    self.output_frame,
+                    text=label_text,
+                    text_color=color,
+                    anchor="w",
+                    font=("Arial", 12),
+                    wraplength=800
+                )
+                label.pack(pady=3, padx=10, fill="x")
         
         # Update summary
         summary = f"Novel: {novel_count} | Not Novel: {not_novel_count} | Unknown: {unknown_count}"
         self.results_label.configure(text=summary)
 
 if __name__ == '__main__':
+    import argparse
+    from SearchApp.instrumentation import profile
+
+    parser = argparse.ArgumentParser(description="Ingredient Novel Food Analyzer")
+    parser.add_argument('--profile', metavar='FILE', help="write a cProfile report (e.g. analyzer.prof)")
+    args = parser.parse_args()
+
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
     
-    app = IngredientAnalyzer()
-    app.mainloop()
\ No newline at end of file
+    if args.profile:
+        with profile(args.profile):
+            app = IngredientAnalyzer()
+            app.mainloop()
+    else:
+        app = IngredientAnalyzer()
+        app.mainloop()
\ No newline at end of file